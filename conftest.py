@@ -0,0 +1,67 @@
+import os
+from unittest.mock import create_autospec, patch
+
+import pytest
+
+import database
+from database import init_database, add_sample_data, get_db_connection
+from services.payment_service import PaymentGateway
+
+# Building a spec'd mock walks the whole class, so do it once and hand the
+# same reset instance to each test instead of re-speccing per test.
+_GW_TEMPLATE = create_autospec(PaymentGateway, instance=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def db(worker_id):
+    """Initialize and seed the database once for the whole test session.
+
+    The suite only passes against a freshly seeded database, so any stale
+    file from a previous run is removed first. Previously test_all.py did
+    the init/seed at import time, which also made test_allai.py depend on
+    test_all.py being collected first.
+
+    Under pytest-xdist each worker gets its own database file, so workers
+    never contend on the same sqlite file and no locking is needed.
+    worker_id is "master" when xdist is not distributing.
+    """
+    if worker_id != "master":
+        database.DATABASE = f"library_{worker_id}.db"
+    if os.path.exists(database.DATABASE):
+        os.remove(database.DATABASE)
+    init_database()
+    add_sample_data()
+    conn = get_db_connection()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _no_sleep():
+    """Disable the simulated API delay in PaymentGateway for the whole run.
+
+    The tests that exercise the real gateway used to patch time.sleep one
+    by one; a single session-wide patch is cheaper and also catches any
+    path that would otherwise really sleep.
+    """
+    with patch("services.payment_service.time.sleep", return_value=None):
+        yield
+
+
+@pytest.fixture
+def fee_and_book():
+    """Patched (calculate_late_fee_for_book, get_book_by_id) pair.
+
+    The pay_late_fees tests all patch the same two targets; this fixture
+    patches them once per test and the tests just assign .return_value.
+    """
+    with patch("services.library_services.calculate_late_fee_for_book") as fee, \
+         patch("services.library_services.get_book_by_id") as book:
+        yield fee, book
+
+
+@pytest.fixture
+def gateway():
+    """A PaymentGateway mock spec'd once per session and reset per test."""
+    _GW_TEMPLATE.reset_mock(return_value=True, side_effect=True)
+    return _GW_TEMPLATE
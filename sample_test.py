@@ -3,6 +3,7 @@ from services.library_service import (
     add_book_to_catalog
 )
 
+@pytest.mark.slow
 def test_add_book_valid_input():
     """Test adding a book with valid input."""
     success, message = add_book_to_catalog("Test Book", "Test Author", "1234567890123", 5)
@@ -32,9 +32,10 @@ from services.library_service import get_patron_status_report, borrow_book_by_pa
 
 from database import init_database, add_sample_data
 
-# Initialize the database and seed it before running tests
-init_database()
-add_sample_data()
+# Database init/seeding now happens once per session in conftest.py
+
+# everything in this module goes through the real sqlite database
+pytestmark = pytest.mark.slow
 
 
 #r1----------------------------------------------------------------------------------------------------------------------------------------
@@ -1,32 +1,17 @@
 import pytest
 
-#for r1
-from services.library_service import add_book_to_catalog
-from database import get_book_by_isbn
-
-#for r2
-from database import get_all_books, insert_book
-
-#for r3
-from services.library_service import borrow_book_by_patron
-from database import get_book_by_id, get_all_books
-
-#for r4
-from services.library_service import return_book_by_patron, borrow_book_by_patron
-from database import get_all_books, get_book_by_id
-
-#for r5
-from services.library_service import calculate_late_fee_for_book
-
-#for r6
-from services.library_service import search_books_in_catalog
-
-#for r7
-from services.library_service import get_patron_status_report, borrow_book_by_patron
-
-#please ignore the multiple imports since it helped me keep track better
-
-from database import init_database, add_sample_data
+from services.library_service import (
+    add_book_to_catalog,
+    borrow_book_by_patron,
+    return_book_by_patron,
+    calculate_late_fee_for_book,
+    search_books_in_catalog,
+    get_patron_status_report,
+)
+from database import insert_book
+
+# shared across the borrow/return negative-path tests below
+INVALID_PATRON_IDS = ("12AB56", "12345!", "abcdef", "1234", "abcdefg")
 
 #r1
 
@@ -56,6 +41,7 @@ def test_insert_book_rejects_negative_availability():
     result = insert_book("Math", "Euler", "9999999999999", 4, 6)
     assert result is False or result is None  # available copies can't exceed total copies if validated
 '''
+@pytest.mark.slow
 def test_insert_book_rejects_negative_availability():
     """insert_book currently allows negative available copies; this test is expected to fail."""
     result = insert_book("Physics", "Newton", "8888888888888", 5, -1)
@@ -66,28 +52,27 @@ def test_insert_book_rejects_negative_availability():
     assert result is True
 #r3
 
+@pytest.mark.slow
 def test_cannot_borrow_book_with_invalid_book_id_type():
     """Pass invalid book_id types (e.g., string) to borrow_book_by_patron"""
     success, msg = borrow_book_by_patron("123456", "not_an_int")
     assert not success
     assert "book" in msg.lower() or "invalid" in msg.lower()
 
-def test_cannot_borrow_with_invalid_patron_id_content():
-    """Patron ID with letters or special characters rejected"""
-    for pid in ["12AB56", "12345!", "abcdef"]:
-        success, msg = borrow_book_by_patron(pid, 1)
-        assert not success
-        assert "patron id" in msg.lower()
+@pytest.mark.parametrize("pid", INVALID_PATRON_IDS)
+def test_invalid_patron_rejected(pid):
+    """Patron IDs with letters, symbols or wrong length rejected on borrow and return"""
+    success, msg = borrow_book_by_patron(pid, 1)
+    assert not success
+    assert "patron id" in msg.lower()
+
+    success, msg = return_book_by_patron(pid, 1)
+    assert not success
+    assert "patron id" in msg.lower()
 
 #r4
 
-def test_return_book_with_invalid_patron_id_type():
-    """Return book with patron ID containing letters or wrong length"""
-    for pid in ["12AB56", "1234", "abcdefg"]:
-        success, msg = return_book_by_patron(pid, 1)
-        assert not success
-        assert "patron id" in msg.lower()
-
+@pytest.mark.slow
 def test_return_book_not_borrowed_by_patron():
     """Try returning a book that was borrowed by another patron"""
     # Assume patron "999999" did not borrow book id 1
@@ -97,6 +82,7 @@ def test_return_book_not_borrowed_by_patron():
 
 #r5
 
+@pytest.mark.slow
 def test_calculate_late_fee_no_borrow_record():
     """Calculate fee for a patron/book combo with no borrow record should return zero fee"""
     result = calculate_late_fee_for_book("000000", 99999)  # unlikely combo
@@ -113,9 +99,11 @@ def test_search_books_with_empty_term_or_type():
 
 #r7
     
+@pytest.mark.slow
 def test_get_status_report_history_ordering():
     """Borrow history should be ordered descending by borrow_date"""
     patron = "111111"
     report = get_patron_status_report(patron)
     dates = [r["borrow_date"] for r in report["history"]]
-    assert dates == sorted(dates, reverse=True)
\ No newline at end of file
+    # single O(n) pass instead of sorting a copy of the list
+    assert all(a >= b for a, b in zip(dates, dates[1:]))
\ No newline at end of file